@@ -1,6 +1,7 @@
 # annofetch/cli.py
 
 import typer
+from concurrent.futures import ThreadPoolExecutor
 from typing_extensions import Annotated
 from annofetch.downloader import EnsemblDownloader
 
@@ -11,13 +12,15 @@ app = typer.Typer(
     rich_markup_mode="rich"
 )
 
-def get_downloader(species: str, release: int, build: str, output_dir: str):
+def get_downloader(species: str, release: int, build: str, output_dir: str, progress_bar: bool = False,
+                   live_progress: bool = True):
     """
     Helper function to initialize the EnsemblDownloader and handle potential errors.
     This avoids code duplication between commands.
     """
     try:
-        return EnsemblDownloader(species=species, release=release, build=build, output_dir=output_dir)
+        return EnsemblDownloader(species=species, release=release, build=build, output_dir=output_dir,
+                                 progress_bar=progress_bar, live_progress=live_progress)
     except ValueError as e:
         print(f"❌ Error: Missing required parameter. {e}")
         raise typer.Exit(code=1)
@@ -33,11 +36,15 @@ def genome(
         "--add-ucsc-style", 
         help="Convert chromosome names to UCSC style (e.g., '1' -> 'chr1'). Requires a mapping file for the build."
     )] = False,
+    progress_bar: Annotated[bool, typer.Option(
+        "--progress-bar",
+        help="Show a full tqdm progress bar instead of the lightweight byte counter."
+    )] = False,
 ):
     """
     Downloads a genome FASTA file from Ensembl.
     """
-    downloader = get_downloader(species, release, build, output_dir)
+    downloader = get_downloader(species, release, build, output_dir, progress_bar)
     
     # --- Robustness Check for Build-Aware Mapping (for genome command) ---
     if add_ucsc_style and not downloader.chr_map:
@@ -45,7 +52,8 @@ def genome(
         print("   Proceeding with download without chromosome name conversion.")
         add_ucsc_style = False # Disable the impossible request
 
-    downloader.download_genome(suffix=suffix, add_ucsc_style=add_ucsc_style)
+    with downloader:
+        downloader.download_genome(suffix=suffix, add_ucsc_style=add_ucsc_style)
 
 @app.command()
 def gtf(
@@ -57,6 +65,10 @@ def gtf(
         "--add-ucsc-style", 
         help="Convert chromosome names to UCSC style (e.g., '1' -> 'chr1'). Requires a mapping file for the build."
     )] = False,
+    progress_bar: Annotated[bool, typer.Option(
+        "--progress-bar",
+        help="Show a full tqdm progress bar instead of the lightweight byte counter."
+    )] = False,
 ):
     """
     Downloads a GTF annotation file with optional chromosome style conversion.
@@ -64,7 +76,7 @@ def gtf(
     """
 
 
-    downloader = get_downloader(species, release, build, output_dir)
+    downloader = get_downloader(species, release, build, output_dir, progress_bar)
     
     # --- Robustness Check for Build-Aware Mapping (for gtf command) ---
     if add_ucsc_style and not downloader.chr_map:
@@ -72,9 +84,47 @@ def gtf(
         print("   Proceeding with download without chromosome name conversion.")
         add_ucsc_style = False
 
-    downloader.download_gtf(
-        add_ucsc_style=add_ucsc_style
-    )
+    with downloader:
+        downloader.download_gtf(
+            add_ucsc_style=add_ucsc_style
+        )
+
+@app.command()
+def fetch(
+    species: Annotated[str, typer.Option(help="Ensembl species name (e.g., 'homo_sapiens')")],
+    release: Annotated[int, typer.Option(help="Ensembl release number (e.g., 112)")],
+    build: Annotated[str, typer.Option(help="Genome build (e.g., 'GRCh38')")],
+    suffix: Annotated[str, typer.Option(help="File suffix for the FASTA file.")] = "primary_assembly",
+    output_dir: Annotated[str, typer.Option(help="Directory to save the files.")] = "resources/ref",
+    add_ucsc_style: Annotated[bool, typer.Option(
+        "--add-ucsc-style", 
+        help="Convert chromosome names to UCSC style (e.g., '1' -> 'chr1'). Requires a mapping file for the build."
+    )] = False,
+    progress_bar: Annotated[bool, typer.Option(
+        "--progress-bar",
+        help="Show a full tqdm progress bar instead of the lightweight byte counter."
+    )] = False,
+):
+    """
+    Downloads both the genome FASTA and the GTF annotation file concurrently.
+    """
+    # Two downloads cannot share one redrawn counter line, so only report when each one finishes
+    downloader = get_downloader(species, release, build, output_dir, progress_bar, live_progress=False)
+
+    # --- Robustness Check for Build-Aware Mapping (for fetch command) ---
+    if add_ucsc_style and not downloader.chr_map:
+        print(f"⚠️  [bold yellow]Warning:[/bold yellow] Cannot perform UCSC style conversion. No mapping file found for build '[bold cyan]{build}[/bold cyan]'.")
+        print("   Proceeding with download without chromosome name conversion.")
+        add_ucsc_style = False
+
+    # Each download streams into its own file, so the two can run side by side on the shared session
+    with downloader, ThreadPoolExecutor(max_workers=2) as executor:
+        genome_job = executor.submit(downloader.download_genome, suffix=suffix, add_ucsc_style=add_ucsc_style)
+        gtf_job = executor.submit(downloader.download_gtf, add_ucsc_style=add_ucsc_style)
+        results = [genome_job.result(), gtf_job.result()]
+
+    if not all(results):
+        raise typer.Exit(code=1)
 
 if __name__ == "__main__":
     app()
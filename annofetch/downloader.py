@@ -1,37 +1,207 @@
 # annofetch/downloader.py
 
-import gzip
+import asyncio
+import functools
+import io
+import os
+import queue
+import re
+import socket
+import sys
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPSConnection
+from urllib3.connectionpool import HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family, create_connection
+from urllib3.util.retry import Retry
 from pathlib import Path
-from tqdm import tqdm
 import importlib.resources
 
-# _load_chromosome_map function remains the same as before
+try:
+    # ISA-L's SIMD-accelerated inflate, available with the 'fast' extra
+    from isal.igzip import IGzipFile
+except ImportError:
+    IGzipFile = None  # streams are inflated with zlib directly
+
+try:
+    # Multi-threaded decompression of seekable local files, available with the 'fast' extra
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
+
+try:
+    # HTTP/2 client used to multiplex range segments over one connection, available with the 'http2' extra
+    import httpx
+    import h2  # noqa: F401 -- httpx needs it for HTTP/2
+except ImportError:
+    httpx = None
+
+@functools.lru_cache(maxsize=32)
 def _load_chromosome_map(filename: str) -> dict:
-    """Loads a two-column chromosome mapping file from the package's data directory."""
-    mapping = {}
+    """Loads a two-column chromosome mapping file from the package's data directory.
+
+    Results are cached per filename; callers must not mutate the returned dict.
+    """
     try:
         file_path = importlib.resources.files('annofetch').joinpath('data').joinpath(filename)
         with file_path.open('r') as f:
-            for line in f:
-                if line.startswith('#') or not line.strip():
-                    continue
-                try:
-                    source_name, target_name = line.strip().split('\t')
-                    mapping[source_name] = target_name
-                except ValueError:
-                    continue
+            # Comments, blank lines and names without a counterpart are skipped
+            rows = (line.strip().split('\t') for line in f if not line.startswith('#'))
+            return dict(fields for fields in rows if len(fields) == 2)
     except FileNotFoundError:
-        pass
-    return mapping
+        return {}
+
+
+def _event_loop_running() -> bool:
+    """Tells whether this thread already runs an asyncio loop (e.g., inside Jupyter)."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _format_bytes(n: float) -> str:
+    """Formats a byte count with a binary unit prefix (e.g., '12.3 MiB')."""
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+        if n < 1024:
+            return f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} TiB"
+
+
+class _Progress:
+    """Lightweight byte counter that redraws a single stderr line at most every `interval` seconds.
+
+    With live=False nothing is drawn until the end, when a single summary line is printed;
+    this keeps concurrent downloads from overwriting each other's line.
+    """
+
+    def __init__(self, desc: str, total: int = None, interval: float = 0.5, live: bool = True):
+        self.desc = desc
+        self.total = total
+        self.interval = interval
+        self.live = live
+        self.n = 0
+        self._start = self._last = time.monotonic()
+        self._last_len = 0  # length of the line currently on screen
+        self._lock = threading.Lock()  # segment downloads update from several threads
+
+    def update(self, n: int):
+        with self._lock:
+            self.n += n
+            now = time.monotonic()
+            if self.live and now - self._last >= self.interval:
+                self._last = now
+                self._render(now)
+
+    def _render(self, now: float, end: str = ''):
+        line = f"{self.desc}: {_format_bytes(self.n)}"
+        if self.total:
+            line += f" / {_format_bytes(self.total)} ({100 * self.n / self.total:.0f}%)"
+        line += f" [{_format_bytes(self.n / max(now - self._start, 1e-9))}/s]"
+        if self.live:
+            # Pad over the previous line, which may be longer (e.g., '1023.9 MiB' -> '1.2 GiB')
+            line, self._last_len = '\r' + line.ljust(self._last_len), len(line)
+        # One write per line, so lines from concurrent downloads never interleave mid-line
+        sys.stderr.write(line + end)
+        sys.stderr.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        with self._lock:
+            self._render(time.monotonic(), end='\n')
+
+
+_resolved_hosts = {}
+
+
+class _CachedDNSHTTPSConnection(HTTPSConnection):
+    """HTTPS connection that resolves its host once per process instead of on every connect.
+
+    Every address returned for the host is cached and tried in turn, as urllib3 does. The
+    hostname is still used for SNI and certificate checks; only the address lookup is cached.
+    If no address accepts the connection the entry is evicted, so a retry resolves it afresh.
+    """
+
+    def _new_conn(self):
+        key = (self.host, self.port)
+        try:
+            if key not in _resolved_hosts:
+                _resolved_hosts[key] = [
+                    sockaddr[0]
+                    for *_, sockaddr in socket.getaddrinfo(self.host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+                ]
+        except socket.gaierror as e:
+            raise NameResolutionError(self.host, self, e) from e
+
+        error = None
+        for address in _resolved_hosts[key]:
+            try:
+                sock = create_connection(
+                    (address, self.port),
+                    self.timeout,
+                    source_address=self.source_address,
+                    socket_options=self.socket_options,
+                )
+                break
+            except OSError as e:
+                error = e
+        else:
+            _resolved_hosts.pop(key, None)
+            if isinstance(error, socket.timeout):
+                raise ConnectTimeoutError(
+                    self, f"Connection to {self.host} timed out. (connect timeout={self.timeout})"
+                ) from error
+            raise NewConnectionError(self, f"Failed to establish a new connection: {error}") from error
+
+        sys.audit("http.client.connect", self, self.host, self.port)
+        return sock
+
+
+class _CachedDNSHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CachedDNSHTTPSConnection
+
+
+class _CachedDNSAdapter(HTTPAdapter):
+    """HTTPAdapter whose HTTPS pools open connections through _CachedDNSHTTPSConnection."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            **self.poolmanager.pool_classes_by_scheme,
+            'https': _CachedDNSHTTPSConnectionPool,
+        }
 
 
 class EnsemblDownloader:
     """Handles downloading and processing of genome and annotation files from Ensembl FTP."""
     BASE_URL = "https://ftp.ensembl.org/pub"
+    GENOME_URL_TEMPLATE = "{base}/release-{release}/fasta/{species}/dna/{Species}.{build}.dna.{suffix}.fa.gz"
+    GTF_URL_TEMPLATE = "{base}/release-{release}/gtf/{species}/{Species}.{build}.{release}.gtf.gz"
+    WRITE_BUFFER_SIZE = 4 << 20
+    COPY_CHUNK_SIZE = 1 << 20
+    RAW_READ_SIZE = 128 * 1024
+    QUEUE_MAXSIZE = 4
+    PROGRESS_INTERVAL = 0.5  # seconds between progress bar refreshes
+    POOL_MAXSIZE = 16
+    SEGMENT_SIZE = 64 << 20  # smallest share of a file worth its own range request
+    MAX_SEGMENTS = 8
+    TIMEOUT = (5, 60)  # (connect, read) seconds
+    RETRY_TOTAL = 5
+    RETRY_BACKOFF = 0.5
+    RETRY_STATUSES = (502, 503, 504)
 
-    def __init__(self, species: str, release: int, build: str, output_dir: str = "."):
-        # ... (init code remains the same as before)
+    def __init__(self, species: str, release: int, build: str, output_dir: str = ".", progress_bar: bool = False,
+                 live_progress: bool = True):
         if not all([species, release, build]):
             raise ValueError("Species, release, and build must be provided.")
         
@@ -40,71 +210,363 @@ class EnsemblDownloader:
         self.build = build
         self.output_path = Path(output_dir)
         self.output_path.mkdir(parents=True, exist_ok=True)
+        self._resolved_out = self.output_path.resolve()
+        self._spec_up = self.species.capitalize()
+        self.progress_bar = progress_bar
+        # Set live_progress=False when running several downloads at once (see the 'fetch' command)
+        self.live_progress = live_progress
+        self._progress_lock = threading.Lock()
+        self._progress_positions = set()
         print(f"🧬 Initialized downloader for {self.species} (release {self.release}, build {self.build})")
 
         map_filename = f"{self.build}_ensembl2UCSC.txt"
         self.chr_map = _load_chromosome_map(map_filename)
+        # Byte-keyed copy for processors that work on undecoded data
+        self.chr_map_bytes = {k.encode('ascii'): v.encode('ascii') for k, v in self.chr_map.items()}
 
         if not self.chr_map:
             print(f"ℹ️  Note: No mapping file found for build '{self.build}'. Chromosome style conversion will be unavailable.")
 
-    # _get_gtf_processor function remains the same as before
+        # A single session keeps connections to the Ensembl server alive across downloads
+        self.session = requests.Session()
+        retries = Retry(total=self.RETRY_TOTAL, backoff_factor=self.RETRY_BACKOFF, status_forcelist=self.RETRY_STATUSES,
+                        raise_on_status=False)
+        self.session.mount("https://", _CachedDNSAdapter(pool_maxsize=self.POOL_MAXSIZE, max_retries=retries))
+
+    def close(self):
+        """Closes the underlying HTTP session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @contextmanager
+    def _progress(self, desc: str, total: int = None):
+        """Yields a byte progress tracker: a tqdm bar if requested, else the lightweight counter.
+
+        Concurrent tqdm bars each get their own terminal line.
+        """
+        if not self.progress_bar:
+            with _Progress(desc, total=total, interval=self.PROGRESS_INTERVAL, live=self.live_progress) as progress:
+                yield progress
+            return
+
+        from tqdm import tqdm
+        with self._progress_lock:
+            position = min(set(range(len(self._progress_positions) + 1)) - self._progress_positions)
+            self._progress_positions.add(position)
+        try:
+            with tqdm(total=total, unit='B', unit_scale=True, desc=desc, position=position,
+                      mininterval=self.PROGRESS_INTERVAL) as progress:
+                yield progress
+        finally:
+            with self._progress_lock:
+                self._progress_positions.discard(position)
+
     def _get_gtf_processor(self, add_ucsc_style: bool):
         """Returns a line-processing function for GTF files based on user's choice."""
         if add_ucsc_style and self.chr_map:
             print(f"   (Note: Using '{self.build}' map to convert GTF chromosome names to UCSC style)")
+            chr_map = self.chr_map
+
             def processor(line: str) -> str:
-                if line.startswith('#'):
+                # Lines whose first column has no mapping are returned as is, without copying
+                if line[:1] == '#':
                     return line
-                fields = line.split('\t')
-                if len(fields) > 0:
-                    fields[0] = self.chr_map.get(fields[0], fields[0])
-                return '\t'.join(fields)
+                i = line.find('\t')
+                if i < 0:
+                    return line
+                new_name = chr_map.get(line[:i])
+                return line if new_name is None else new_name + line[i:]
             return processor
                   
         return None
 
     def _get_fasta_processor(self, add_ucsc_style: bool):
-        """Returns a line-processing function for FASTA files based on user's choice."""
+        """Returns a chunk-processing function for FASTA files based on user's choice.
+
+        The processor works on raw bytes holding whole lines, so the sequence data never
+        needs to be decoded.
+        """
         if add_ucsc_style and self.chr_map:
             print(f"   (Note: Using '{self.build}' map to convert FASTA chromosome names to UCSC style)")
-            def processor(line: str) -> str:
-                if line.startswith('>'):
-                    # Extract current chromosome name from FASTA header (e.g., '>1 dna:chromosome ...')
-                    # It's the part between '>' and the first space.
-                    header_parts = line[1:].split(' ', 1) # Split only on the first space
-                    current_chr_name = header_parts[0]
-                    
-                    # Apply mapping
-                    new_chr_name = self.chr_map.get(current_chr_name, current_chr_name)
-                    
-                    # Reconstruct the header line
-                    if len(header_parts) > 1:
-                        return f">{new_chr_name} {header_parts[1]}"
-                    else:
-                        return f">{new_chr_name}\n" # Ensure newline for single-part headers
-                return line # Return sequence lines unchanged
+            chr_map = self.chr_map_bytes
+            # The chromosome name is the part of the header between '>' and the first space
+            # (e.g., '>1 dna:chromosome ...')
+            header = re.compile(rb'^>([^ \n]+)', re.M)
+
+            def rename(match) -> bytes:
+                name = match.group(1)
+                return b'>' + chr_map.get(name, name)
+
+            def processor(chunk: bytes) -> bytes:
+                # Headers are rare; most chunks hold sequence only and pass through untouched
+                if b'>' not in chunk:
+                    return chunk
+                return header.sub(rename, chunk)
             return processor
         return None
 
-    # _download_and_process_stream function remains the same as before
-    def _download_and_process_stream(self, url: str, output_file: Path, line_processor=None):
-        """Generic downloader with on-the-fly decompression and line-by-line processing."""
+    def _decompress_in_background(self, source):
+        """Yields the chunks of the decompressing generator source, running it on a worker thread."""
+        chunks = queue.Queue(maxsize=self.QUEUE_MAXSIZE)
+        stop = threading.Event()
+        errors = []
+
+        def put(item) -> bool:
+            # Give up once the consumer has gone away, so the worker never blocks forever
+            while not stop.is_set():
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce():
+            try:
+                with closing(source):
+                    for chunk in source:
+                        if not put(chunk):
+                            return
+            except Exception as e:
+                errors.append(e)
+            put(None)
+
+        worker = threading.Thread(target=produce, name="annofetch-inflate", daemon=True)
+        worker.start()
+        try:
+            while (chunk := chunks.get()) is not None:
+                yield chunk
+            if errors:
+                raise errors[0]
+        finally:
+            stop.set()
+            worker.join()
+
+    @staticmethod
+    def _whole_lines(chunks):
+        """Regroups byte chunks so that each yielded chunk ends on a line boundary."""
+        # Chunks end mid-line; carry the partial last line over to the next one
+        carry = b''
+        for chunk in chunks:
+            chunk = carry + chunk
+            cut = chunk.rfind(b'\n') + 1
+            carry = chunk[cut:]
+            if cut:
+                yield chunk[:cut]
+        if carry:
+            yield carry
+
+    def _ranged_size(self, url: str) -> int:
+        """Returns the size of the remote file if it is worth fetching in parallel ranges, else 0."""
+        r = self.session.head(url, allow_redirects=True, timeout=self.TIMEOUT)
+        r.raise_for_status()
+        size = int(r.headers.get('content-length', 0))
+        if r.headers.get('accept-ranges') != 'bytes' or size < 2 * self.SEGMENT_SIZE:
+            return 0
+        return size
+
+    def _download_segment(self, url: str, part_file: Path, start: int, end: int, progress_bar):
+        """Fetches bytes start..end (inclusive) of url into the same offsets of part_file."""
+        headers = {'Range': f'bytes={start}-{end}'}
+        with self.session.get(url, headers=headers, stream=True, timeout=self.TIMEOUT) as r:
+            r.raise_for_status()
+            if r.status_code != 206:
+                raise ValueError(f"Server ignored the range request for {url}")
+            written = 0
+            with open(part_file, 'r+b') as f_out:
+                f_out.seek(start)
+                for chunk in r.raw.stream(self.COPY_CHUNK_SIZE, decode_content=False):
+                    f_out.write(chunk)
+                    written += len(chunk)
+                    progress_bar.update(len(chunk))
+        if written != end - start + 1:
+            raise ValueError(f"Incomplete segment {start}-{end} from {url}")
+
+    async def _download_segment_http2(self, client, url: str, part_file: Path, start: int, end: int, progress_bar):
+        """Async counterpart of _download_segment, streaming over a shared httpx client.
+
+        Transient failures are retried with the same policy as the requests session, resuming
+        after the bytes already written. Disk writes run on a worker thread so they do not
+        stall the other streams on the connection.
+        """
+        offset = start
+        with open(part_file, 'r+b') as f_out:
+            f_out.seek(start)
+            for attempt in range(self.RETRY_TOTAL + 1):
+                if attempt:
+                    await asyncio.sleep(self.RETRY_BACKOFF * 2 ** (attempt - 1))
+                try:
+                    async with client.stream('GET', url, headers={'Range': f'bytes={offset}-{end}'}) as r:
+                        if r.status_code in self.RETRY_STATUSES and attempt < self.RETRY_TOTAL:
+                            continue
+                        r.raise_for_status()
+                        if r.status_code != 206:
+                            raise ValueError(f"Server ignored the range request for {url}")
+                        async for chunk in r.aiter_raw(self.COPY_CHUNK_SIZE):
+                            await asyncio.to_thread(f_out.write, chunk)
+                            offset += len(chunk)
+                            progress_bar.update(len(chunk))
+                except httpx.TransportError:
+                    if attempt == self.RETRY_TOTAL:
+                        raise
+                    continue
+                break
+        if offset != end + 1:
+            raise ValueError(f"Incomplete segment {start}-{end} from {url}")
+
+    async def _download_segments_http2(self, url: str, part_file: Path, bounds: list, progress_bar):
+        """Fetches all segments concurrently as streams multiplexed on one HTTP/2 connection."""
+        limits = httpx.Limits(max_keepalive_connections=self.MAX_SEGMENTS)
+        timeout = httpx.Timeout(self.TIMEOUT[1], connect=self.TIMEOUT[0])
+        async with httpx.AsyncClient(http2=True, limits=limits, timeout=timeout, follow_redirects=True) as client:
+            await asyncio.gather(*(
+                self._download_segment_http2(client, url, part_file, start, end, progress_bar)
+                for start, end in bounds
+            ))
+
+    def _download_segments(self, url: str, part_file: Path, size: int):
+        """Downloads url into part_file as parallel range requests.
+
+        With httpx installed the segments share one HTTP/2 connection; otherwise each one
+        runs on a thread over the pooled requests session.
+        """
+        n_segments = min(self.MAX_SEGMENTS, size // self.SEGMENT_SIZE)
+        bounds = [(i * size // n_segments, (i + 1) * size // n_segments - 1) for i in range(n_segments)]
+        with open(part_file, 'wb') as f_out:
+            f_out.truncate(size)
+
+        with self._progress(part_file.name, total=size) as progress_bar:
+            if httpx is not None and not _event_loop_running():
+                asyncio.run(self._download_segments_http2(url, part_file, bounds, progress_bar))
+                return
+            with ThreadPoolExecutor(max_workers=n_segments) as executor:
+                jobs = [executor.submit(self._download_segment, url, part_file, start, end, progress_bar)
+                        for start, end in bounds]
+                for job in jobs:
+                    job.result()
+
+    def _inflate(self, raw):
+        """Yields decompressed chunks of the gzip stream raw, driving zlib directly.
+
+        This skips GzipFile's Python-level buffering, CRC and header bookkeeping; zlib still
+        verifies the CRC and size trailer of every member.
+        """
+        decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+        for data in iter(lambda: raw.read(self.RAW_READ_SIZE), b''):
+            while True:
+                if decompressor.eof:
+                    # Another member follows (e.g., bgzip output); files may also be padded with zeros
+                    data = data.lstrip(b'\x00')
+                    if not data:
+                        break
+                    decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+                chunk = decompressor.decompress(data, self.COPY_CHUNK_SIZE)
+                data = decompressor.unused_data if decompressor.eof else decompressor.unconsumed_tail
+                if chunk:
+                    yield chunk
+                # A full chunk may leave output pending inside zlib even with no input left
+                if not data and len(chunk) < self.COPY_CHUNK_SIZE:
+                    break
+        if not decompressor.eof:
+            raise EOFError("Compressed file ended before the end-of-stream marker was reached")
+
+    def _decompressed_chunks(self, compressed):
+        """Yields decompressed chunks of compressed, a gzip file object or a local Path.
+
+        Local files are decompressed on all cores when rapidgzip is installed; otherwise ISA-L
+        is used if available, and zlib if not.
+        """
+        if isinstance(compressed, Path):
+            if rapidgzip is not None:
+                gz_file = rapidgzip.open(str(compressed), parallelization=os.cpu_count())
+            else:
+                with open(compressed, 'rb') as raw:
+                    yield from self._decompressed_chunks(raw)
+                return
+        elif IGzipFile is not None:
+            gz_file = IGzipFile(fileobj=compressed, mode='rb')
+        else:
+            yield from self._inflate(compressed)
+            return
+
+        with gz_file:
+            # read() rather than read1(): read1 returns small pieces, which costs far more
+            # queue hand-offs than it saves in joins
+            yield from iter(lambda: gz_file.read(self.COPY_CHUNK_SIZE), b'')
+
+    @staticmethod
+    def _release_page_cache(f_out):
+        """Advises the OS to drop f_out from the page cache, where supported.
+
+        Outputs are written once and not read back, so keeping gigabytes of them cached
+        only evicts more useful data. This is best-effort: pages still waiting for writeback
+        stay cached, and filesystems that reject the advice are ignored.
+        """
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        f_out.flush()
+        try:
+            os.posix_fadvise(f_out.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+    def _decompress_and_process(self, compressed, output_file: Path, line_processor=None, chunk_processor=None):
+        """Decompresses compressed (a file object or a local Path) into output_file, applying the given processor."""
+        # The decompressed size is unknown up front, so progress counts bytes written
+        with self._progress(output_file.name) as progress_bar:
+            if line_processor is None and chunk_processor is None:
+                # Nothing to rewrite: copy decompressed bytes straight to disk, no decoding
+                with open(output_file, 'wb', buffering=self.WRITE_BUFFER_SIZE) as f_out, \
+                     closing(self._decompress_in_background(self._decompressed_chunks(compressed))) as chunks:
+                    for chunk in chunks:
+                        f_out.write(chunk)
+                        progress_bar.update(len(chunk))
+                    self._release_page_cache(f_out)
+            elif line_processor is None:
+                with open(output_file, 'wb', buffering=self.WRITE_BUFFER_SIZE) as f_out, \
+                     closing(self._decompress_in_background(self._decompressed_chunks(compressed))) as chunks:
+                    for chunk in self._whole_lines(chunks):
+                        f_out.write(chunk_processor(chunk))
+                        progress_bar.update(len(chunk))
+                    self._release_page_cache(f_out)
+            else:
+                with open(output_file, 'w', encoding='utf-8', buffering=self.WRITE_BUFFER_SIZE) as f_out, \
+                     closing(self._decompress_in_background(self._decompressed_chunks(compressed))) as chunks:
+                    for chunk in self._whole_lines(chunks):
+                        text = chunk.decode('utf-8')
+                        f_out.writelines(map(line_processor, io.StringIO(text, newline='')))
+                        progress_bar.update(len(chunk))
+                    self._release_page_cache(f_out)
+
+    def _download_and_process_stream(self, url: str, output_file: Path, line_processor=None, chunk_processor=None):
+        """Generic downloader with on-the-fly decompression and line-by-line processing.
+
+        ``line_processor`` rewrites one decoded line at a time, while ``chunk_processor``
+        rewrites raw bytes made of whole lines. If neither is given the data is copied as is.
+        Large files on servers that accept range requests are first fetched in parallel
+        segments to a local ``.gz.part`` file, then decompressed from disk.
+        """
         print(f"⬇️ Downloading from: {url}")
         try:
-            with requests.get(url, stream=True) as r:
-                r.raise_for_status()
-                total_size = int(r.headers.get('content-length', 0))
-                
-                with tqdm(total=total_size, unit='B', unit_scale=True, desc=output_file.name) as progress_bar:
-                    with gzip.GzipFile(fileobj=r.raw) as gz_file, open(output_file, 'w', encoding='utf-8') as f_out:
-                        for line in (l.decode('utf-8') for l in gz_file):
-                            if line_processor:
-                                line = line_processor(line)
-                            f_out.write(line)
-                            progress_bar.update(r.raw.tell() - progress_bar.n)
-
-            print(f"✅ Successfully downloaded and saved to {output_file.resolve()}")
+            size = self._ranged_size(url)
+            if size:
+                part_file = output_file.with_name(output_file.name + '.gz.part')
+                try:
+                    self._download_segments(url, part_file, size)
+                    self._decompress_and_process(part_file, output_file, line_processor, chunk_processor)
+                finally:
+                    part_file.unlink(missing_ok=True)
+            else:
+                with self.session.get(url, stream=True, timeout=self.TIMEOUT) as r:
+                    r.raise_for_status()
+                    self._decompress_and_process(r.raw, output_file, line_processor, chunk_processor)
+
+            print(f"✅ Successfully downloaded and saved to {output_file}")
             return True
 
         except requests.exceptions.HTTPError as e:
@@ -118,26 +580,23 @@ class EnsemblDownloader:
 
     def download_genome(self, suffix: str = "primary_assembly", add_ucsc_style: bool = False):
         """Downloads a genome FASTA file with optional chromosome style conversion."""
-        spec_up = self.species.capitalize()
-        url = (
-            f"{self.BASE_URL}/release-{self.release}/fasta/{self.species}/dna/"
-            f"{spec_up}.{self.build}.dna.{suffix}.fa.gz"
+        url = self.GENOME_URL_TEMPLATE.format(
+            base=self.BASE_URL, release=self.release, species=self.species,
+            Species=self._spec_up, build=self.build, suffix=suffix,
         )
-        output_file = self.output_path / f"{self.species}_{self.build}_{self.release}.fa"
+        output_file = self._resolved_out / f"{self.species}_{self.build}_{self.release}.fa"
         
         processor = self._get_fasta_processor(add_ucsc_style=add_ucsc_style)
         
-        return self._download_and_process_stream(url, output_file, line_processor=processor)
+        return self._download_and_process_stream(url, output_file, chunk_processor=processor)
 
-    # download_gtf function remains the same as before
     def download_gtf(self, add_ucsc_style: bool = False):
         """Downloads a GTF annotation file with optional chromosome style conversion."""
-        spec_up = self.species.capitalize()
-        url = (
-            f"{self.BASE_URL}/release-{self.release}/gtf/{self.species}/"
-            f"{spec_up}.{self.build}.{self.release}.gtf.gz"
+        url = self.GTF_URL_TEMPLATE.format(
+            base=self.BASE_URL, release=self.release, species=self.species,
+            Species=self._spec_up, build=self.build,
         )
-        output_file = self.output_path / f"{self.species}_{self.build}_{self.release}.gtf"
+        output_file = self._resolved_out / f"{self.species}_{self.build}_{self.release}.gtf"
         
         processor = self._get_gtf_processor(
             add_ucsc_style=add_ucsc_style